@@ -9,8 +9,10 @@ from ansible.galaxy.user_agent import user_agent
 from ansible.module_utils.urls import open_url
 
 import contextlib
+import functools
 import inspect
 import os
+import re
 import subprocess
 import typing as t
 
@@ -47,6 +49,7 @@ def run_gpg_verify(
     display,  # type: Display
 ):  # type: (...) -> tuple[str, int]
     status_fd_read, status_fd_write = os.pipe()
+    status_reader = os.fdopen(status_fd_read)
 
     # running the gpg command will create the keyring if it does not exist
     remove_keybox = not os.path.exists(keyring)
@@ -69,17 +72,19 @@ def run_gpg_verify(
         p = subprocess.Popen(
             cmd,
             stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
+            # only the status fd and stderr are consumed, don't buffer stdout
+            stdout=subprocess.DEVNULL,
             stderr=subprocess.PIPE,
             pass_fds=(status_fd_write,),
             encoding='utf8',
         )
     except (FileNotFoundError, subprocess.SubprocessError) as err:
+        status_reader.close()
         raise AnsibleError(
             f"Failed during GnuPG verification with command '{cmd_str}': {err}"
         ) from err
     else:
-        stdout, stderr = p.communicate(input=signature)
+        stderr = p.communicate(input=signature)[1]
     finally:
         os.close(status_fd_write)
 
@@ -87,7 +92,7 @@ def run_gpg_verify(
         with contextlib.suppress(OSError):
             os.remove(keyring)
 
-    with os.fdopen(status_fd_read) as f:
+    with status_reader as f:
         stdout = f.read()
         display.vvvv(
             f"stdout: \n{stdout}\nstderr: \n{stderr}\n(exit code {p.returncode})"
@@ -95,15 +100,14 @@ def run_gpg_verify(
         return stdout, p.returncode
 
 
+# each status line is '[GNUPG:] KEYWORD [args...]', scanned in one pass
+# instead of splitlines() plus per-line splits
+_STATUS_LINE = re.compile(r'^\S+[ \t]+(\S+)(?:[ \t]+(.+))?$', re.MULTILINE)
+
+
 def parse_gpg_errors(status_out):  # type: (str) -> t.Iterator[GpgBaseError]
-    for line in status_out.splitlines():
-        if not line:
-            continue
-        try:
-            _dummy, status, remainder = line.split(maxsplit=2)
-        except ValueError:
-            _dummy, status = line.split(maxsplit=1)
-            remainder = None
+    for match in _STATUS_LINE.finditer(status_out):
+        status, remainder = match.groups()
 
         try:
             cls = GPG_ERROR_MAP[status]
@@ -112,12 +116,7 @@ def parse_gpg_errors(status_out):  # type: (str) -> t.Iterator[GpgBaseError]
 
         fields = [status]
         if remainder:
-            fields.extend(
-                remainder.split(
-                    None,
-                    len(dc_fields(cls)) - 2
-                )
-            )
+            fields.extend(remainder.split(None, _SPLIT_COUNTS[cls]))
 
         yield cls(*fields)
 
@@ -127,15 +126,21 @@ class GpgBaseError(Exception):
     status: str
 
     @classmethod
+    @functools.cache
     def get_gpg_error_description(cls) -> str:
         """Return the current class description."""
         return ' '.join(cls.__doc__.split())
 
     def __post_init__(self):
-        for field_name, field_type in inspect.get_annotations(type(self), eval_str=True).items():
+        for field_name, field_type in _field_annotations(type(self)):
             super(GpgBaseError, self).__setattr__(field_name, field_type(getattr(self, field_name)))
 
 
+@functools.cache
+def _field_annotations(cls):  # type: (type) -> tuple[tuple[str, type], ...]
+    return tuple(inspect.get_annotations(cls, eval_str=True).items())
+
+
 @dataclass(frozen=True, slots=True)
 class GpgExpSig(GpgBaseError):
     """The signature with the keyid is good, but the signature is expired."""
@@ -276,3 +281,7 @@ GPG_ERROR_MAP = {
     'KEYREVOKED': GpgKeyRevoked,
     'NO_SECKEY': GpgNoSecKey,
 }
+
+# maxsplit values for parse_gpg_errors, precomputed so the dataclass fields
+# are not re-walked for every status line
+_SPLIT_COUNTS = {cls: len(dc_fields(cls)) - 2 for cls in GPG_ERROR_MAP.values()}
@@ -18,6 +18,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping, MutableMapping
+from itertools import chain
 
 from ansible.inventory.group import Group, InventoryObjectType
 from ansible.parsing.utils.addresses import patterns
@@ -48,7 +49,9 @@ class Host:
         return not self.__eq__(other)
 
     def __hash__(self):
-        return hash(self.name)
+        # hash on the same immutable identity as __eq__; hosts can be renamed
+        # while sitting in dicts/sets, but the uuid never changes
+        return hash(self._uuid)
 
     def __str__(self):
         return self.get_name()
@@ -87,6 +90,9 @@ class Host:
 
     def __init__(self, name=None, port=None, gen_uuid=True):
 
+        self._vars_cache = None
+        self._group_names_cache = None
+        self._short_name_cache = None
         self.vars = {}
         self.groups = []
         self._uuid = None
@@ -101,18 +107,37 @@ class Host:
             self._uuid = get_unique_id()
         self.implicit = False
 
+    @property
+    def vars(self):
+        return self._vars
+
+    @vars.setter
+    def vars(self, value):
+        # callers (re)assign host.vars wholesale, so treat assignment as a
+        # cache invalidation point
+        self._vars = value
+        self._vars_cache = None
+
     def get_name(self):
         return self.name
 
     def populate_ancestors(self, additions=None):
         # populate ancestors
         if additions is None:
-            for group in self.groups:
-                self.add_group(group)
+            # breadth-first walk over all parent edges at once, rather than a
+            # full get_ancestors() traversal per current group
+            seen = set(self.groups)
+            unprocessed = set(chain.from_iterable(g.parent_groups for g in self.groups)) - seen
+            while unprocessed:
+                seen.update(unprocessed)
+                self.groups.extend(unprocessed)
+                self._invalidate_group_caches()
+                unprocessed = set(chain.from_iterable(g.parent_groups for g in unprocessed)) - seen
         else:
             for group in additions:
                 if group not in self.groups:
                     self.groups.append(group)
+                    self._invalidate_group_caches()
 
     def add_group(self, group):
         added = False
@@ -120,10 +145,12 @@ class Host:
         for oldg in group.get_ancestors():
             if oldg not in self.groups:
                 self.groups.append(oldg)
+                self._invalidate_group_caches()
 
         # actually add group
         if group not in self.groups:
             self.groups.append(group)
+            self._invalidate_group_caches()
             added = True
         return added
 
@@ -131,23 +158,32 @@ class Host:
         removed = False
         if group in self.groups:
             self.groups.remove(group)
+            self._invalidate_group_caches()
             removed = True
 
             # remove exclusive ancestors, xcept all!
-            for oldg in group.get_ancestors():
-                if oldg.name != 'all':
-                    for childg in self.groups:
-                        if oldg in childg.get_ancestors():
-                            break
-                    else:
-                        self.remove_group(oldg)
+            # an ancestor survives only if some remaining non-ancestor group
+            # still leads to it; get_ancestors() is a transitive closure, so
+            # one pass over the survivors replaces the old recursive walk
+            candidates = {g for g in group.get_ancestors() if g.name != 'all'}
+            if candidates:
+                still_needed = set()
+                for childg in self.groups:
+                    if childg not in candidates:
+                        still_needed.update(childg.get_ancestors())
+                self.groups = [g for g in self.groups if g not in candidates or g in still_needed]
         return removed
 
+    def _invalidate_group_caches(self):
+        self._vars_cache = None
+        self._group_names_cache = None
+
     def set_variable(self, key, value):
         if key in self.vars and isinstance(self.vars[key], MutableMapping) and isinstance(value, Mapping):
             self.vars = combine_vars(self.vars, {key: value})
         else:
             self.vars[key] = value
+        self._vars_cache = None
 
     def get_groups(self):
         return self.groups
@@ -155,14 +191,30 @@ class Host:
     def get_magic_vars(self):
         results = {}
         results['inventory_hostname'] = self.name
-        if patterns['ipv4'].match(self.name) or patterns['ipv6'].match(self.name):
-            results['inventory_hostname_short'] = self.name
-        else:
-            results['inventory_hostname_short'] = self.name.split('.')[0]
 
-        results['group_names'] = sorted([g.name for g in self.get_groups() if g.name != 'all'])
+        # the short name only depends on the name, which is assigned directly
+        # in places, so key the cache on it
+        if self._short_name_cache is None or self._short_name_cache[0] != self.name:
+            if patterns['ipv4'].match(self.name) or patterns['ipv6'].match(self.name):
+                short_name = self.name
+            else:
+                short_name = self.name.split('.')[0]
+            self._short_name_cache = (self.name, short_name)
+        results['inventory_hostname_short'] = self._short_name_cache[1]
+
+        if self._group_names_cache is None:
+            self._group_names_cache = sorted(g.name for g in self.get_groups() if g.name != 'all')
+        results['group_names'] = self._group_names_cache
 
         return results
 
     def get_vars(self):
-        return combine_vars(self.vars, self.get_magic_vars())
+        # cached until vars or group membership change, as this is called once
+        # per host per task
+        if self._vars_cache is None:
+            if self.vars:
+                self._vars_cache = combine_vars(self.vars, self.get_magic_vars())
+            else:
+                # nothing to merge, and get_magic_vars() builds a fresh dict
+                self._vars_cache = self.get_magic_vars()
+        return self._vars_cache
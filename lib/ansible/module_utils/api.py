@@ -29,7 +29,6 @@ import copy
 import functools
 import itertools
 import random
-import sys
 import time
 
 import ansible.module_utils.compat.typing as t
@@ -79,16 +78,14 @@ def rate_limit(rate=None, rate_limit=None):
         last = [0.0]
 
         def ratelimited(*args, **kwargs):
-            if sys.version_info >= (3, 8):
-                real_time = time.process_time
-            else:
-                real_time = time.clock
             if minrate is not None:
-                elapsed = real_time() - last[0]
+                # monotonic wall clock, unlike process_time which stands
+                # still while this process sleeps or waits on I/O
+                elapsed = time.monotonic() - last[0]
                 left = minrate - elapsed
                 if left > 0:
                     time.sleep(left)
-                last[0] = real_time()
+                last[0] = time.monotonic()
             ret = f(*args, **kwargs)
             return ret
 
@@ -101,21 +98,18 @@ def retry(retries=None, retry_pause=1):
     def wrapper(f):
 
         def retried(*args, **kwargs):
-            retry_count = 0
-            if retries is not None:
-                ret = None
-                while True:
-                    retry_count += 1
-                    if retry_count >= retries:
-                        raise Exception("Retry limit exceeded: %d" % retries)
-                    try:
-                        ret = f(*args, **kwargs)
-                    except Exception:
-                        pass
-                    if ret:
-                        break
+            if retries is None:
+                return None
+            for attempt in range(retries):
+                if attempt:
                     time.sleep(retry_pause)
-                return ret
+                try:
+                    ret = f(*args, **kwargs)
+                except Exception:
+                    continue
+                if ret:
+                    return ret
+            raise Exception("Retry limit exceeded: %d" % retries)
 
         return retried
     return wrapper
@@ -144,6 +138,14 @@ def retry_with_delays_and_condition(backoff_iterator, should_retry_error=None):
     :param backoff_iterator: An iterable of delays in seconds.
     :param should_retry_error: A callable that takes an exception of the decorated function and decides whether to retry or not (returns a bool).
     """
+    if should_retry_error is None or should_retry_error is retry_never:
+        # no error is ever retried, so the decorated function behaves exactly
+        # like the bare function and none of the iterator copying machinery
+        # below is needed
+        def null_wrapper(function):
+            return function
+        return null_wrapper
+
     def _emit_isolated_iterator_copies(original_iterator):  # type: (t.Iterable[t.Any]) -> t.Generator
         # Ref: https://stackoverflow.com/a/30232619/595220
         _copiable_iterator, _first_iterator_copy = itertools.tee(original_iterator)
@@ -153,9 +155,6 @@ def retry_with_delays_and_condition(backoff_iterator, should_retry_error=None):
     backoff_iterator_generator = _emit_isolated_iterator_copies(backoff_iterator)
     del backoff_iterator  # prevent accidental use elsewhere
 
-    if should_retry_error is None:
-        should_retry_error = retry_never
-
     def function_wrapper(function):
         @functools.wraps(function)
         def run_function(*args, **kwargs):
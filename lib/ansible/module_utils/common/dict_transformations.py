@@ -6,6 +6,7 @@
 from __future__ import annotations
 
 
+import functools
 import re
 from copy import deepcopy
 
@@ -26,31 +27,31 @@ def camel_dict_to_snake_dict(camel_dict, reversible=False, ignore_list=()):
     the 'Tags' key but nothing below.
     """
 
-    def value_is_list(camel_list):
-
-        checked_list = []
-        for item in camel_list:
-            if isinstance(item, dict):
-                checked_list.append(camel_dict_to_snake_dict(item, reversible))
-            elif isinstance(item, list):
-                checked_list.append(value_is_list(item))
-            else:
-                checked_list.append(item)
-
-        return checked_list
-
     snake_dict = {}
     for k, v in camel_dict.items():
         if isinstance(v, dict) and k not in ignore_list:
             snake_dict[_camel_to_snake(k, reversible=reversible)] = camel_dict_to_snake_dict(v, reversible)
         elif isinstance(v, list) and k not in ignore_list:
-            snake_dict[_camel_to_snake(k, reversible=reversible)] = value_is_list(v)
+            snake_dict[_camel_to_snake(k, reversible=reversible)] = _camel_list_to_snake_list(v, reversible)
         else:
             snake_dict[_camel_to_snake(k, reversible=reversible)] = v
 
     return snake_dict
 
 
+def _camel_list_to_snake_list(camel_list, reversible):
+    checked_list = []
+    for item in camel_list:
+        if isinstance(item, dict):
+            checked_list.append(camel_dict_to_snake_dict(item, reversible))
+        elif isinstance(item, list):
+            checked_list.append(_camel_list_to_snake_list(item, reversible))
+        else:
+            checked_list.append(item)
+
+    return checked_list
+
+
 def snake_dict_to_camel_dict(snake_dict, capitalize_first=False):
     """
     Perhaps unexpectedly, snake_dict_to_camel_dict returns dromedaryCase
@@ -82,30 +83,38 @@ def _snake_to_camel(snake, capitalize_first=False):
         return snake.split('_')[0] + ''.join(x.capitalize() or '_' for x in snake.split('_')[1:])
 
 
-def _camel_to_snake(name, reversible=False):
+_UPPER_PATTERN = re.compile(r'[A-Z]')
+# Cope with pluralized abbreviations such as TargetGroupARNs
+# that would otherwise be rendered target_group_ar_ns
+_PLURAL_UPPER_PATTERN = re.compile(r'[A-Z]{3,}s$')
+# Remainder of solution seems to be https://stackoverflow.com/a/1176023
+_FIRST_CAP_PATTERN = re.compile(r'(.)([A-Z][a-z]+)')
+_ALL_CAP_PATTERN = re.compile(r'([a-z0-9])([A-Z]+)')
+
 
-    def prepend_underscore_and_lower(m):
-        return '_' + m.group(0).lower()
+def _prepend_underscore_and_lower(m):
+    return '_' + m.group(0).lower()
+
+
+# keys are drawn from a small vocabulary (e.g. API response field names), so
+# cache the conversion per key rather than re-running the regexes
+@functools.lru_cache(maxsize=4096)
+def _camel_to_snake(name, reversible=False):
 
     if reversible:
-        upper_pattern = r'[A-Z]'
+        upper_pattern = _UPPER_PATTERN
     else:
-        # Cope with pluralized abbreviations such as TargetGroupARNs
-        # that would otherwise be rendered target_group_ar_ns
-        upper_pattern = r'[A-Z]{3,}s$'
+        upper_pattern = _PLURAL_UPPER_PATTERN
 
-    s1 = re.sub(upper_pattern, prepend_underscore_and_lower, name)
+    s1 = upper_pattern.sub(_prepend_underscore_and_lower, name)
     # Handle when there was nothing before the plural_pattern
     if s1.startswith("_") and not name.startswith("_"):
         s1 = s1[1:]
     if reversible:
         return s1
 
-    # Remainder of solution seems to be https://stackoverflow.com/a/1176023
-    first_cap_pattern = r'(.)([A-Z][a-z]+)'
-    all_cap_pattern = r'([a-z0-9])([A-Z]+)'
-    s2 = re.sub(first_cap_pattern, r'\1_\2', s1)
-    return re.sub(all_cap_pattern, r'\1_\2', s2).lower()
+    s2 = _FIRST_CAP_PATTERN.sub(r'\1_\2', s1)
+    return _ALL_CAP_PATTERN.sub(r'\1_\2', s2).lower()
 
 
 def dict_merge(a, b):
@@ -41,7 +41,15 @@ class TestHost(unittest.TestCase):
 
     def test_hashability(self):
         # equality implies the hash values are the same
-        self.assertEqual(hash(self.hostA), hash(Host('a')))
+        hostA_clone = Host()
+        hostA_clone.deserialize(self.hostA.serialize())
+        self.assertEqual(self.hostA, hostA_clone)
+        self.assertEqual(hash(self.hostA), hash(hostA_clone))
+
+    def test_hash_stable_across_rename(self):
+        hash_before = hash(self.hostA)
+        self.hostA.name = 'renamed'
+        self.assertEqual(hash(self.hostA), hash_before)
 
     def test_get_vars(self):
         host_vars = self.hostA.get_vars()
@@ -48,10 +48,38 @@ class TestRetry:
 
         @retry(retries=1)
         def login_database():
-            return 'success'
+            login_database.counter += 1
+            raise CustomException("Login failed")
+
+        login_database.counter = 0
+        with pytest.raises(Exception, match="Retry"):
+            login_database()
+        assert login_database.counter == 1
+
+    def test_all_retries_used(self):
+
+        @retry(retries=3, retry_pause=0)
+        def login_database():
+            login_database.counter += 1
+            return None
 
+        login_database.counter = 0
         with pytest.raises(Exception, match="Retry"):
             login_database()
+        assert login_database.counter == 3
+
+    def test_success_after_retry(self):
+
+        @retry(retries=3, retry_pause=0)
+        def login_database():
+            login_database.counter += 1
+            if login_database.counter == 1:
+                raise CustomException("Login failed")
+            return 'success'
+
+        login_database.counter = 0
+        assert login_database() == 'success'
+        assert login_database.counter == 2
 
     def test_no_retries(self):
 